@@ -1,20 +1,54 @@
+import asyncio
 import logging
 import os
-import requests
-from datetime import datetime, timedelta, time
+from collections import OrderedDict
+from itertools import islice
+from time import monotonic
+from zoneinfo import ZoneInfo
+import aiosqlite
+import httpx
+import orjson
+from datetime import date, datetime, timedelta, time, tzinfo
 from telegram import Bot, Update, ForceReply, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, CallbackQueryHandler, filters
+from telegram.ext import AIORateLimiter, Application, CommandHandler, ContextTypes, Defaults, MessageHandler, CallbackQueryHandler, filters
+
+try:
+    from itertools import batched
+except ImportError:  # Python < 3.12
+    def batched(iterable, n):
+        """Yields successive tuples of n items from iterable (the last may be shorter)."""
+        it = iter(iterable)
+        while chunk := tuple(islice(it, n)):
+            yield chunk
 
 # Configuration
 # Replace with your actual bot token
 
-# Global state to store user's last selected country and city
-# Key: user_id (int), Value: {'country': str, 'city': str}
-user_locations = {}
+# SQLite database holding each user's saved location, so it survives restarts
+DB_PATH = "locations.db"
+
+# Per-user state lives in context.user_data:
+# "location": {'country': str, 'city': str} - cached copy of the saved location
+# "awaiting_city": str - country chosen while we wait for the city name
+# "last_times": float - monotonic time of the user's last accepted /times
+
+# Maximum number of concurrent Aladhan requests made by the monthly cache prewarm
+PREWARM_CONCURRENCY = 5
+
+# Repeated /times from the same user within this many seconds are ignored
+TIMES_DEBOUNCE_SECONDS = 2.0
+
+# Cache of Aladhan timings, one calendar month per location, least recently used first
+# Key: (city, country, year, month), Value: {date: timings} ({} if Aladhan rejected the location)
+PRAYER_CACHE: OrderedDict[tuple[str, str, int, int], dict[date, dict]] = OrderedDict()
+PRAYER_CACHE_MAXSIZE = 512
+
+# Month fetches currently in flight, so concurrent misses for a location share one request
+# Key: (city, country, year, month), Value: asyncio.Task resolving to the month's timings
+PENDING_FETCHES: dict[tuple[str, str, int, int], asyncio.Task] = {}
 
-# Global state to track users awaiting city input
-# Key: user_id (int), Value: country_name (str)
-users_awaiting_city = {}
+# Aladhan status codes meaning the city/country could not be resolved
+LOCATION_NOT_FOUND_STATUSES = (400, 404)
 
 # List of common Arabic-speaking countries for inline buttons
 COUNTRIES = [
@@ -22,6 +56,30 @@ COUNTRIES = [
     "الأردن", "فلسطين", "لبنان", "سوريا", "العراق", "اليمن", "الجزائر",
     "المغرب", "تونس", "ليبيا", "السودان", "موريتانيا", "جيبوتي", "الصومال"
 ]
+
+# Country selection buttons shown on /start, three per row (identical for every user)
+# Callback data carries the index into COUNTRIES to keep the payload small
+_START_MARKUP = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton(country, callback_data=f"c_{i * 3 + j}") for j, country in enumerate(row)]
+        for i, row in enumerate(batched(COUNTRIES, 3))
+    ]
+)
+# Prayer times response, filled with the location and the results of calculate_times
+# (Islamic Midnight line removed as requested)
+RESPONSE_TMPL = (
+    "--- أوقات الصلاة واقتراحات النوم لـ {city}, {country} ---\n\n"
+    "🌅 وقت صلاة المغرب: {Maghrib}\n"
+    "🌃 وقت صلاة العشاء: {Isha}\n"
+    "🌄 وقت صلاة الفجر: {Fajr} (في اليوم التالي)\n\n"
+    "⏱️ مدة الليل بين المغرب والفجر: {Night_Duration}\n\n"
+    "🛌 اقتراحات:\n"
+    "1. موعد الاستيقاظ المقترح (منتصف الليل الشرعي): {Wake_Up_Suggestion}\n"
+    "2. موعد النوم المقترح (بداية السدس الأخير من الليل): {Sleep_Suggestion}\n\n"
+    "ملاحظة: هذه الأوقات هي للتوجيه والعبادة، وقد تختلف مواعيد الصلاة الفعلية حسب طريقة الحساب المعتمدة في منطقتك.\n"
+    "يمكنك استخدام الأمر /times للحصول على الأوقات لنفس الموقع لاحقاً."
+)
+
 # NOTE: You must ask the user for their token before running the bot.
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 
@@ -34,15 +92,81 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+def _load_timezone() -> tzinfo:
+    """
+    Returns the zone used for "today" and for scheduled jobs.
+    
+    BOT_TIMEZONE (an IANA name such as "Africa/Cairo") takes precedence; otherwise the
+    host's local zone is used, as a real zone so jobs keep their wall-clock time across DST.
+    """
+    name = os.getenv("BOT_TIMEZONE")
+    if name:
+        return ZoneInfo(name)
+    
+    try:
+        with open("/etc/localtime", "rb") as f:
+            return ZoneInfo.from_file(f, key="localtime")
+    except (OSError, ValueError):
+        logger.warning("Could not read the host time zone; set BOT_TIMEZONE to keep jobs correct across DST")
+        return datetime.now().astimezone().tzinfo
+
+TIMEZONE = _load_timezone()
+
 # --- Utility Functions ---
 
-def get_prayer_times(city: str, country: str) -> dict | None:
-    """Fetches prayer times for a given city and country using Aladhan API."""
-    # Use the current date
-    date_str = datetime.now().strftime("%d-%m-%Y")
+def normalize_city(city: str) -> str:
+    """Collapses whitespace and case so "cairo", " Cairo " and "CAIRO" share a cache entry."""
+    return " ".join(city.split()).casefold()
+
+def _clean_timings(timings: dict) -> dict:
+    """Trims Aladhan timings such as "18:42 (EET)" down to plain "HH:MM"."""
+    return {name: value[:5] for name, value in timings.items()}
+
+async def get_month_timings(client: httpx.AsyncClient, city: str, country: str, year: int, month: int) -> dict[date, dict] | None:
+    """
+    Fetches a whole month of prayer times for a given city and country using Aladhan API.
     
+    Returns an empty dict when Aladhan rejects the location (400/404, e.g. a misspelled city)
+    and None when the fetch failed for any other reason, so it can be retried.
+    """
+    url = "https://api.aladhan.com/v1/calendarByCity"
+    
+    params = {
+        "city": city,
+        "country": country,
+        "method": 5, # Egyptian General Authority of Survey - A common and reliable method
+        "month": month,
+        "year": year
+    }
+    
+    try:
+        response = await client.get(url, params=params)
+        response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
+        data = orjson.loads(response.content)
+        
+        if data and data.get("data") and isinstance(data["data"], list):
+            # Index each day's timings by its Gregorian date ("DD-MM-YYYY")
+            return {
+                datetime.strptime(day["date"]["gregorian"]["date"], "%d-%m-%Y").date(): _clean_timings(day["timings"])
+                for day in data["data"]
+            }
+        else:
+            logger.error("API response error or missing data: %s", data)
+            return None
+            
+    except httpx.HTTPStatusError as e:
+        logger.error("Error fetching monthly prayer times: %s", e)
+        # Only 400/404 mean Aladhan does not know the location; 429, 403, 408 etc. are transient
+        return {} if e.response.status_code in LOCATION_NOT_FOUND_STATUSES else None
+        
+    except (httpx.HTTPError, KeyError, ValueError) as e:
+        logger.error("Error fetching monthly prayer times: %s", e)
+        return None
+
+async def get_day_timings(client: httpx.AsyncClient, city: str, country: str, day: date) -> dict | None:
+    """Fetches prayer times for a single day for a given city and country using Aladhan API."""
     # API endpoint for a specific date
-    url = f"http://api.aladhan.com/v1/timingsByCity/{date_str}"
+    url = f"https://api.aladhan.com/v1/timingsByCity/{day.strftime('%d-%m-%Y')}"
     
     params = {
         "city": city,
@@ -51,20 +175,94 @@ def get_prayer_times(city: str, country: str) -> dict | None:
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = await client.get(url, params=params)
         response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
-        data = response.json()
+        data = orjson.loads(response.content)
         
         if data and data.get("data") and data["data"].get("timings"):
-            return data["data"]["timings"]
+            return _clean_timings(data["data"]["timings"])
         else:
-            logger.error(f"API response error or missing data: {data}")
+            logger.error("API response error or missing data: %s", data)
             return None
             
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error fetching prayer times: {e}")
+    except (httpx.HTTPError, KeyError, ValueError) as e:
+        logger.error("Error fetching prayer times: %s", e)
         return None
 
+async def _fetch_and_cache_month(client: httpx.AsyncClient, city: str, country: str, year: int, month: int, key: tuple) -> dict[date, dict] | None:
+    """Fetches a month of prayer times and stores it in the cache."""
+    month_timings = await get_month_timings(client, city, country, year, month)
+    # Rejected locations are cached too (as an empty dict) so they are not retried all month
+    if month_timings is not None:
+        PRAYER_CACHE[key] = month_timings
+        # Evict the least recently used location once the cache is full
+        if len(PRAYER_CACHE) > PRAYER_CACHE_MAXSIZE:
+            PRAYER_CACHE.popitem(last=False)
+    return month_timings
+
+async def get_cached_month_timings(client: httpx.AsyncClient, city: str, country: str, year: int, month: int) -> dict[date, dict] | None:
+    """Returns a month of prayer times from the cache, fetching and caching it on a miss."""
+    key = (normalize_city(city), country, year, month)
+    if key in PRAYER_CACHE:
+        PRAYER_CACHE.move_to_end(key)
+        return PRAYER_CACHE[key]
+    
+    # Concurrent misses for the same location share a single in-flight fetch
+    task = PENDING_FETCHES.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_and_cache_month(client, city, country, year, month, key))
+        PENDING_FETCHES[key] = task
+        task.add_done_callback(lambda _: PENDING_FETCHES.pop(key, None))
+    
+    # Shield the shared fetch so one cancelled caller does not cancel it for the others
+    return await asyncio.shield(task)
+
+async def get_prayer_times(client: httpx.AsyncClient, city: str, country: str) -> dict | None:
+    """Returns today's prayer times for a given city and country, fetching a month at a time."""
+    # Use the current date
+    today = datetime.now(TIMEZONE).date()
+    
+    # Timings never change, so one calendar fetch serves the location for the rest of the month
+    month_timings = await get_cached_month_timings(client, city, country, today.year, today.month)
+    if not month_timings:
+        return None
+    
+    if today in month_timings:
+        return month_timings[today]
+    
+    # Fall back to fetching only today if the calendar has no entry for it
+    return await get_day_timings(client, city, country, today)
+
+async def get_location(context: ContextTypes.DEFAULT_TYPE, user_id: int) -> dict | None:
+    """Returns the saved location for a user, checking the user's in-memory data first."""
+    location = context.user_data.get("location")
+    if location is not None:
+        return location
+    
+    async with context.bot_data["db"].execute("SELECT city, country FROM loc WHERE user_id = ?", (user_id,)) as cursor:
+        row = await cursor.fetchone()
+    
+    if row is None:
+        return None
+    
+    context.user_data["location"] = {'city': row[0], 'country': row[1]}
+    return context.user_data["location"]
+
+async def save_location(context: ContextTypes.DEFAULT_TYPE, user_id: int, city: str, country: str) -> None:
+    """Saves a user's location to the database and the user's in-memory data."""
+    db = context.bot_data["db"]
+    await db.execute("INSERT OR REPLACE INTO loc VALUES (?, ?, ?)", (user_id, city, country))
+    await db.commit()
+    context.user_data["location"] = {'city': city, 'country': country}
+
+def _hm(s: str) -> time:
+    """Parses an "HH:MM" string into a time without going through strptime."""
+    return time(int(s[:2]), int(s[3:5]))
+
+def _fmt(dt: datetime) -> str:
+    """Formats a datetime as "HH:MM" without going through strftime."""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
 def calculate_times(timings: dict) -> dict:
     """
     Calculates Islamic Midnight and suggested sleep times based on Maghrib and Fajr.
@@ -78,7 +276,7 @@ def calculate_times(timings: dict) -> dict:
     
     # Parse times from string "HH:MM" to datetime.datetime objects
     # We need to assume Maghrib and Isha are on the current day, and Fajr is on the next day
-    today = datetime.now().date()
+    today = datetime.now(TIMEZONE).date()
     tomorrow = today + timedelta(days=1)
     
     try:
@@ -87,14 +285,14 @@ def calculate_times(timings: dict) -> dict:
         fajr_time_str = timings["Fajr"]
         
         # Maghrib and Isha on today
-        maghrib_dt = datetime.combine(today, datetime.strptime(maghrib_time_str, "%H:%M").time())
-        isha_dt = datetime.combine(today, datetime.strptime(isha_time_str, "%H:%M").time())
+        maghrib_dt = datetime.combine(today, _hm(maghrib_time_str))
+        isha_dt = datetime.combine(today, _hm(isha_time_str))
         
         # Fajr on tomorrow
-        fajr_dt = datetime.combine(tomorrow, datetime.strptime(fajr_time_str, "%H:%M").time())
+        fajr_dt = datetime.combine(tomorrow, _hm(fajr_time_str))
         
     except (ValueError, KeyError) as e:
-        logger.error(f"Error parsing time strings: {e}")
+        logger.error("Error parsing time strings: %s", e)
         return {}
 
     # 1. Calculate Night Duration (D)
@@ -114,13 +312,13 @@ def calculate_times(timings: dict) -> dict:
     
     # Format results
     return {
-        "Maghrib": maghrib_dt.strftime("%H:%M"),
-        "Isha": isha_dt.strftime("%H:%M"),
-        "Fajr": fajr_dt.strftime("%H:%M"),
+        "Maghrib": _fmt(maghrib_dt),
+        "Isha": _fmt(isha_dt),
+        "Fajr": _fmt(fajr_dt),
         "Night_Duration": str(night_duration).split('.')[0], # Remove microseconds
-        "Islamic_Midnight": midnight_dt.strftime("%H:%M"),
-        "Wake_Up_Suggestion": wake_up_dt.strftime("%H:%M"),
-        "Sleep_Suggestion": sleep_dt.strftime("%H:%M"),
+        "Islamic_Midnight": _fmt(midnight_dt),
+        "Wake_Up_Suggestion": _fmt(wake_up_dt),
+        "Sleep_Suggestion": _fmt(sleep_dt),
     }
 
 # --- Telegram Bot Handlers ---
@@ -129,34 +327,28 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Sends a welcome message and country selection buttons when /start is issued."""
     user = update.effective_user
     
-    # Create country selection buttons
-    keyboard = []
-    for i in range(0, len(COUNTRIES), 3):
-        row = []
-        for country in COUNTRIES[i:i+3]:
-            row.append(InlineKeyboardButton(country, callback_data=f"country_{country}"))
-        keyboard.append(row)
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
     await update.message.reply_html(
-        rf"مرحباً {user.mention_html()}! أنا بوت لحساب أوقات الصلاة واقتراح أوقات النوم.",
-    )
-    await update.message.reply_text(
-        "الرجاء اختيار الدولة أولاً:",
-        reply_markup=reply_markup
+        rf"مرحباً {user.mention_html()}! أنا بوت لحساب أوقات الصلاة واقتراح أوقات النوم."
+        "\n\nالرجاء اختيار الدولة أولاً:",
+        reply_markup=_START_MARKUP
     )
 
 async def times_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Fetches prayer times for the saved location."""
+    # Drop rapid repeats so a user mashing /times only triggers one lookup
+    now = monotonic()
+    if now - context.user_data.get("last_times", float("-inf")) < TIMES_DEBOUNCE_SECONDS:
+        return
+    context.user_data["last_times"] = now
+    
     user_id = update.effective_user.id
-    if user_id not in user_locations:
+    location = await get_location(context, user_id)
+    if location is None:
         await update.message.reply_text(
             "لم تقم بحفظ موقع بعد. الرجاء استخدام /start لاختيار الدولة وإدخال المدينة أولاً."
         )
         return
     
-    location = user_locations[user_id]
     city = location['city']
     country = location['country']
     
@@ -168,20 +360,24 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     query = update.callback_query
     await query.answer()
     
-    user_id = query.from_user.id
-    
-    if query.data.startswith("country_"):
+    if query.data.startswith("c_"):
+        country = COUNTRIES[int(query.data[2:])]
+    elif query.data.startswith("country_"):
+        # Keyboards sent before callback data switched to indices carry the country name
         country = query.data.split("_", 1)[1]
-        users_awaiting_city[user_id] = country
-        
-        await query.edit_message_text(
-            text=f"لقد اخترت: **{country}**.\nالآن، الرجاء إرسال اسم المدينة في **{country}** فقط.",
-            parse_mode='Markdown'
-        )
+    else:
+        return
+    
+    context.user_data["awaiting_city"] = country
+    
+    await query.edit_message_text(
+        text=f"لقد اخترت: **{country}**.\nالآن، الرجاء إرسال اسم المدينة في **{country}** فقط.",
+        parse_mode='Markdown'
+    )
 
 async def fetch_and_send_times(update: Update, context: ContextTypes.DEFAULT_TYPE, city: str, country: str) -> None:
     """Fetches prayer times and sends the formatted result."""
-    timings = get_prayer_times(city, country)
+    timings = await get_prayer_times(context.bot_data["http"], city, country)
     
     if not timings:
         await update.message.reply_text(
@@ -198,21 +394,7 @@ async def fetch_and_send_times(update: Update, context: ContextTypes.DEFAULT_TYP
         )
         return
 
-    # Prepare the response message (Removed Islamic Midnight line as requested)
-    response_text = (
-        f"--- أوقات الصلاة واقتراحات النوم لـ {city}, {country} ---\n\n"
-        f"🌅 وقت صلاة المغرب: {results['Maghrib']}\n"
-        f"🌃 وقت صلاة العشاء: {results['Isha']}\n"
-        f"🌄 وقت صلاة الفجر: {results['Fajr']} (في اليوم التالي)\n\n"
-        f"⏱️ مدة الليل بين المغرب والفجر: {results['Night_Duration']}\n\n"
-        f"🛌 اقتراحات:\n"
-        f"1. موعد الاستيقاظ المقترح (منتصف الليل الشرعي): {results['Wake_Up_Suggestion']}\n"
-        f"2. موعد النوم المقترح (بداية السدس الأخير من الليل): {results['Sleep_Suggestion']}\n\n"
-        "ملاحظة: هذه الأوقات هي للتوجيه والعبادة، وقد تختلف مواعيد الصلاة الفعلية حسب طريقة الحساب المعتمدة في منطقتك.\n"
-        "يمكنك استخدام الأمر /times للحصول على الأوقات لنفس الموقع لاحقاً."
-    )
-    
-    await update.message.reply_text(response_text)
+    await update.message.reply_text(RESPONSE_TMPL.format(city=city, country=country, **results))
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Sends a help message when the command /help is issued."""
@@ -230,17 +412,18 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handles incoming text messages, either as a city name or an invalid command."""
     user_id = update.effective_user.id
-    text = update.message.text.strip()
+    text = " ".join(update.message.text.split())
     
-    if user_id in users_awaiting_city:
-        country = users_awaiting_city.pop(user_id)
+    country = context.user_data.pop("awaiting_city", None)
+    if country is not None:
         city = text
         
         # Save location
-        user_locations[user_id] = {'city': city, 'country': country}
+        await save_location(context, user_id, city, country)
         
-        await update.message.reply_text(f"تم حفظ موقعك: {city}, {country}.")
-        await update.message.reply_text(f"جارٍ البحث عن أوقات الصلاة في {city}, {country}...")
+        await update.message.reply_text(
+            f"تم حفظ موقعك: {city}, {country}.\nجارٍ البحث عن أوقات الصلاة في {city}, {country}..."
+        )
         
         await fetch_and_send_times(update, context, city, country)
         return
@@ -251,12 +434,76 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     )
 
 
+async def prewarm_cache(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Fetches the new month's prayer times for last month's cached locations at month rollover."""
+    today = datetime.now(TIMEZONE).date()
+    last_month = today.replace(day=1) - timedelta(days=1)
+    
+    # Last month's cache entries are the recently used locations (oldest first), so at most
+    # PRAYER_CACHE_MAXSIZE of them; rejected locations ({}) are not retried
+    locations = [
+        (city, country)
+        for (city, country, year, month), month_timings in list(PRAYER_CACHE.items())
+        if (year, month) == (last_month.year, last_month.month) and month_timings
+    ]
+    semaphore = asyncio.Semaphore(PREWARM_CONCURRENCY)
+    
+    async def warm(city: str, country: str) -> dict[date, dict] | None:
+        async with semaphore:
+            return await get_cached_month_timings(context.bot_data["http"], city, country, today.year, today.month)
+    
+    # One bad location must not abort the rest of the prewarm
+    results = await asyncio.gather(*(warm(city, country) for city, country in locations), return_exceptions=True)
+    
+    warmed = 0
+    for (city, country), result in zip(locations, results):
+        if isinstance(result, Exception):
+            logger.error("Error prewarming prayer times for %s, %s", city, country, exc_info=result)
+        elif result:
+            warmed += 1
+    logger.info("Prewarmed prayer times for %s of %s locations", warmed, len(locations))
+
+async def post_init(application: Application) -> None:
+    """Creates the shared HTTP client and opens the locations database."""
+    # One pooled client for all users, so keep-alive connections to Aladhan are reused
+    application.bot_data["http"] = httpx.AsyncClient(
+        timeout=10,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+    
+    db = await aiosqlite.connect(DB_PATH)
+    await db.execute("PRAGMA journal_mode=WAL")
+    await db.execute("PRAGMA synchronous=NORMAL")
+    await db.execute(
+        "CREATE TABLE IF NOT EXISTS loc (user_id INTEGER PRIMARY KEY, city TEXT, country TEXT)"
+    )
+    await db.commit()
+    application.bot_data["db"] = db
+
+async def post_shutdown(application: Application) -> None:
+    """Closes the shared HTTP client and the locations database."""
+    await application.bot_data["http"].aclose()
+    await application.bot_data["db"].close()
+
+
 def main() -> None:
     """Start the bot."""
     # Create the Application and pass it your bot's token.
 
 
-    application = Application.builder().token(BOT_TOKEN).build()
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        # Process updates from different users concurrently instead of one at a time
+        .concurrent_updates(True)
+        .defaults(Defaults(block=False, tzinfo=TIMEZONE))
+        # Keep outgoing messages within Telegram's flood limits and retry on RetryAfter
+        .rate_limiter(AIORateLimiter(overall_max_rate=30, overall_time_period=1, max_retries=3))
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
 
     # on different commands - answer in Telegram
     application.add_handler(CommandHandler("start", start))
@@ -269,6 +516,9 @@ def main() -> None:
     # on non command i.e message - handle the message
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
 
+    # refresh the prayer times cache for recently used locations when a new month starts
+    application.job_queue.run_monthly(prewarm_cache, when=time(0, 5, tzinfo=TIMEZONE), day=1)
+
     # Run the bot until the user presses Ctrl-C
     print("Bot is running... Press Ctrl-C to stop.")
     application.run_polling(allowed_updates=Update.ALL_TYPES)